@@ -10,9 +10,17 @@ import webbrowser
 # API endpoints
 CODEFORCES_API = "https://codeforces.com/api/contest.list"
 
+# Auto-refresh interval (30 minutes)
+REFRESH_INTERVAL_MS = 1800000
+
 class ContestReminderGUI:
-    def __init__(self, root):
+    def __init__(self, root, now=None, http_get=None,
+                 api_url=CODEFORCES_API, auto_refresh=True):
         self.root = root
+        # Clock and transport are injectable so the simulator can drive them
+        self.now = now
+        self.http_get = http_get
+        self.api_url = api_url
         self.root.title("Contest Reminder")
         # Position on right side
         self.root.update_idletasks()
@@ -39,8 +47,8 @@ class ContestReminderGUI:
         self.setup_gui()
         
         # Start auto-refresh
-        self.refresh_contests()
-        self.auto_refresh()
+        if auto_refresh:
+            self.auto_refresh()
     
     def setup_gui(self):
         # Title Frame
@@ -148,13 +156,17 @@ class ContestReminderGUI:
         # For horizontal scroll if needed
         self.canvas.xview_scroll(int(-1*(event.delta/120)), "units")
     
+    def _now(self, tz=None):
+        """Current time from the injected clock, or datetime.now"""
+        return (self.now or datetime.now)(tz)
+    
     def fetch_contests(self):
         """Fetch all contests from different platforms"""
         all_contests = []
         
         # Fetch Codeforces
         try:
-            response = requests.get(CODEFORCES_API, timeout=10)
+            response = (self.http_get or requests.get)(self.api_url, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -173,7 +185,7 @@ class ContestReminderGUI:
         
         # Generate CodeChef contests (Every Wednesday at 8:00 PM IST)
         local_tz = pytz.timezone('Asia/Kolkata')
-        current_time = datetime.now(local_tz)
+        current_time = self._now(local_tz)
         
         days_until_wednesday = (2 - current_time.weekday()) % 7
         if days_until_wednesday == 0 and current_time.hour >= 20:
@@ -264,7 +276,7 @@ class ContestReminderGUI:
         # Time info
         local_tz = pytz.timezone('Asia/Kolkata')
         start_local = contest['start_time'].astimezone(local_tz)
-        current_time = datetime.now(local_tz)
+        current_time = self._now(local_tz)
         time_diff = start_local - current_time
         
         time_text = start_local.strftime('%a, %d %b at %H:%M')
@@ -310,7 +322,7 @@ class ContestReminderGUI:
             return
         
         local_tz = pytz.timezone('Asia/Kolkata')
-        current_time = datetime.now(local_tz)
+        current_time = self._now(local_tz)
         
         # Find the next contest
         valid_contests = []
@@ -359,7 +371,7 @@ class ContestReminderGUI:
         self.contests.sort(key=lambda x: x['start_time'])
         
         local_tz = pytz.timezone('Asia/Kolkata')
-        current_time = datetime.now(local_tz)
+        current_time = self._now(local_tz)
         
         for contest in self.contests:
             start_local = contest['start_time'].astimezone(local_tz)
@@ -392,13 +404,13 @@ class ContestReminderGUI:
         """Update the display after fetching contests"""
         self.update_next_contest_display()
         self.display_contests()
-        self.status_label.config(text=f"Updated: {datetime.now().strftime('%H:%M')}")
+        self.status_label.config(text=f"Updated: {self._now().strftime('%H:%M')}")
         self.refresh_btn.config(state="normal")
     
     def auto_refresh(self):
         """Auto-refresh every 30 minutes"""
         self.refresh_contests()
-        self.root.after(1800000, self.auto_refresh)  # 30 minutes
+        self.root.after(REFRESH_INTERVAL_MS, self.auto_refresh)
 
 def main():
     root = tk.Tk()
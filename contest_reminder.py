@@ -7,10 +7,11 @@ from dateutil import parser
 # Direct API endpoints
 CODEFORCES_API = "https://codeforces.com/api/contest.list"
 
-def fetch_codeforces_contests():
+def fetch_codeforces_contests(http_get=None, api_url=CODEFORCES_API):
     """Fetch contests directly from Codeforces API"""
+    http_get = http_get or requests.get
     try:
-        response = requests.get(CODEFORCES_API, timeout=10)
+        response = http_get(api_url, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -31,11 +32,11 @@ def fetch_codeforces_contests():
         print(f"Error fetching from Codeforces: {e}")
         return []
 
-def generate_codechef_contests():
+def generate_codechef_contests(now=None):
     """Generate CodeChef contest schedule - Every Wednesday at 8:00 PM IST"""
     contests = []
     local_tz = pytz.timezone('Asia/Kolkata')
-    current_time = datetime.now(local_tz)
+    current_time = (now or datetime.now)(local_tz)
     
     # Find next Wednesday
     days_until_wednesday = (2 - current_time.weekday()) % 7
@@ -59,11 +60,11 @@ def generate_codechef_contests():
     
     return contests
 
-def generate_leetcode_contests():
+def generate_leetcode_contests(now=None):
     """Generate LeetCode contest schedule based on their fixed pattern"""
     contests = []
     local_tz = pytz.timezone('Asia/Kolkata')
-    current_time = datetime.now(local_tz)
+    current_time = (now or datetime.now)(local_tz)
     
     # Weekly Contest - Every Sunday at 8:00 AM IST
     days_until_sunday = (6 - current_time.weekday()) % 7
@@ -115,7 +116,7 @@ def get_contest_category(contest_date, current_date):
     else:
         return "LATER"
 
-def display_all_contests(all_contests):
+def display_all_contests(all_contests, now=None):
     """Display all contests sorted by platform priority and time"""
     print("\n" + "="*70)
     print("UPCOMING PROGRAMMING CONTESTS (Next 2 Weeks)")
@@ -130,7 +131,7 @@ def display_all_contests(all_contests):
     all_contests.sort(key=lambda x: (platform_priority.get(x['platform'], 99), x['start_time']))
     
     local_tz = pytz.timezone('Asia/Kolkata')
-    current_time = datetime.now(local_tz)
+    current_time = (now or datetime.now)(local_tz)
     current_platform = None
     
     # Color codes for terminal (will be used in GUI later)
@@ -183,26 +184,26 @@ def display_all_contests(all_contests):
         print(f"   🔗 Link: {contest['url']}")
         print("-" * 70)
 
-def main():
+def main(now=None, http_get=None, api_url=CODEFORCES_API):
     print("Fetching contest data...")
     
     # Fetch from all platforms
     all_contests = []
     
     # Codeforces
-    cf_contests = fetch_codeforces_contests()
+    cf_contests = fetch_codeforces_contests(http_get, api_url)
     all_contests.extend(cf_contests)
     
     # CodeChef (generated from schedule)
-    cc_contests = generate_codechef_contests()
+    cc_contests = generate_codechef_contests(now)
     all_contests.extend(cc_contests)
     
     # LeetCode (generated from schedule)
-    lc_contests = generate_leetcode_contests()
+    lc_contests = generate_leetcode_contests(now)
     all_contests.extend(lc_contests)
     
     # Display all contests
-    display_all_contests(all_contests)
+    display_all_contests(all_contests, now)
     
     # Summary
     print("\n" + "="*70)
@@ -210,7 +211,7 @@ def main():
     print("="*70)
     
     local_tz = pytz.timezone('Asia/Kolkata')
-    current_time = datetime.now(local_tz)
+    current_time = (now or datetime.now)(local_tz)
     
     platform_count = {}
     today_count = 0
@@ -0,0 +1,341 @@
+import argparse
+import io
+import json
+import random
+import statistics
+import threading
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytz
+import requests
+
+import contest_reminder
+from contest_gui import REFRESH_INTERVAL_MS
+
+local_tz = pytz.timezone('Asia/Kolkata')
+
+
+class FakeClock:
+    """Drop-in replacement for datetime.now that only moves when advanced"""
+
+    def __init__(self, start):
+        self.current = start
+
+    def __call__(self, tz=None):
+        if tz is None:
+            # Mirror datetime.now(): naive system-local time
+            return self.current.astimezone().replace(tzinfo=None)
+        return self.current.astimezone(tz)
+
+    def advance(self, delta):
+        self.current += delta
+
+
+class CountingTransport:
+    """Wrap requests.get and record fetch counts, bytes and failures"""
+
+    def __init__(self, http_get=None):
+        self.http_get = http_get
+        self.fetches = 0
+        self.failures = 0
+        self.bytes = 0
+        self.fetch_times = []
+
+    def __call__(self, url, **kwargs):
+        self.fetches += 1
+        start = time.perf_counter()
+        try:
+            response = (self.http_get or requests.get)(url, **kwargs)
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.fetch_times.append(time.perf_counter() - start)
+        self.bytes += len(response.content)
+        if response.status_code != 200:
+            self.failures += 1
+        return response
+
+
+class StandInCodeforces:
+    """Local server mimicking Codeforces contest.list"""
+
+    def __init__(self, clock, size=50, latency=0.0, failure_rate=0.0, seed=0, port=0):
+        self.clock = clock
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.contests = self._generate_contests(size)
+
+        server = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/contest.list"
+
+    def _generate_contests(self, size):
+        """Spread contests from a month before to a month after the clock's start"""
+        start = int(self.clock(pytz.UTC).timestamp())
+        contests = []
+        for i in range(size):
+            offset = self.random.randint(-30 * 86400, 30 * 86400)
+            contests.append({
+                'id': 2000 + i,
+                'name': f'Codeforces Round {900 + i}',
+                'type': 'CF',
+                'startTimeSeconds': start - start % 300 + offset - offset % 300,
+                'durationSeconds': self.random.choice([7200, 8100, 9000, 10800]),
+            })
+        return contests
+
+    def _payload(self):
+        """Build the contest.list response with phases relative to the clock"""
+        now = self.clock(pytz.UTC).timestamp()
+        result = []
+        for contest in self.contests:
+            start = contest['startTimeSeconds']
+            if now < start:
+                phase = 'BEFORE'
+            elif now < start + contest['durationSeconds']:
+                phase = 'CODING'
+            else:
+                phase = 'FINISHED'
+            result.append({**contest, 'phase': phase, 'frozen': False,
+                           'relativeTimeSeconds': int(now - start)})
+        return {'status': 'OK', 'result': result}
+
+    def _handle(self, request):
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self.lock:
+            failed = self.random.random() < self.failure_rate
+
+        if request.path.split('?')[0] != '/api/contest.list':
+            status, body = 404, {'status': 'FAILED', 'comment': 'Not found'}
+        elif failed:
+            status, body = 503, {'status': 'FAILED', 'comment': 'Service temporarily unavailable'}
+        else:
+            status, body = 200, self._payload()
+
+        data = json.dumps(body).encode('utf-8')
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(data)))
+        request.end_headers()
+        request.wfile.write(data)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class GuiRenderer:
+    """Run refresh cycles through ContestReminderGUI on a hidden window"""
+
+    def __init__(self, root, clock, transport, api_url, auto_refresh=False):
+        from contest_gui import ContestReminderGUI
+        self.root = root
+        self.render_times = []
+        self.app = ContestReminderGUI(root, now=clock, http_get=transport,
+                                      api_url=api_url, auto_refresh=False)
+
+        # Time update_display where the refresh thread hands off to Tk
+        update_display = self.app.update_display
+        def timed_update_display():
+            start = time.perf_counter()
+            update_display()
+            self.root.update_idletasks()
+            self.render_times.append(time.perf_counter() - start)
+        self.app.update_display = timed_update_display
+
+        # Start only once the wrapper is in place so the first render is timed
+        if auto_refresh:
+            with redirect_stdout(io.StringIO()):
+                self.app.auto_refresh()
+
+    def wait_for_refresh(self, timeout=30):
+        """Pump the Tk loop until the status label reports the refresh finished"""
+        deadline = time.perf_counter() + timeout
+        with redirect_stdout(io.StringIO()):
+            while not self.app.status_label.cget('text').startswith('Updated'):
+                if time.perf_counter() > deadline:
+                    raise TimeoutError("Refresh did not finish")
+                self.root.update()
+                time.sleep(0.001)
+
+    def refresh(self):
+        self.app.refresh_contests()
+        self.wait_for_refresh()
+        return len(self.app.contests), self.render_times[-1]
+
+    def close(self):
+        self.root.destroy()
+
+
+class ConsoleRenderer:
+    """Run refresh cycles through the console reminder when no display exists"""
+
+    def __init__(self, clock, transport, api_url):
+        self.clock = clock
+        self.transport = transport
+        self.api_url = api_url
+        self.contests = []
+
+    def refresh(self):
+        with redirect_stdout(io.StringIO()):
+            self.contests = contest_reminder.fetch_codeforces_contests(self.transport, self.api_url)
+        self.contests += contest_reminder.generate_codechef_contests(self.clock)
+        self.contests += contest_reminder.generate_leetcode_contests(self.clock)
+
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            contest_reminder.display_all_contests(self.contests, self.clock)
+        return len(self.contests), time.perf_counter() - start
+
+    def close(self):
+        pass
+
+
+def make_renderer(clock, transport, api_url, headless=False):
+    """Prefer the real GUI, fall back to the console output without a display"""
+    if not headless:
+        import tkinter as tk
+        try:
+            root = tk.Tk()
+        except tk.TclError as e:
+            print(f"GUI unavailable ({e}), using console renderer")
+        else:
+            root.withdraw()
+            try:
+                return GuiRenderer(root, clock, transport, api_url)
+            except Exception:
+                root.destroy()
+                raise
+    return ConsoleRenderer(clock, transport, api_url)
+
+
+def run_simulation(start, days=7, interval=timedelta(milliseconds=REFRESH_INTERVAL_MS),
+                   size=50, latency=0.0, failure_rate=0.0, seed=0, headless=False):
+    """Replay auto-refresh cycles against the stand-in server and collect stats"""
+    if interval <= timedelta(0):
+        raise ValueError("interval must be positive")
+    clock = FakeClock(start)
+    server = StandInCodeforces(clock, size=size, latency=latency,
+                               failure_rate=failure_rate, seed=seed).start()
+    transport = CountingTransport()
+    renderer = make_renderer(clock, transport, server.url, headless)
+
+    cycles = int(timedelta(days=days) / interval)
+    render_times = []
+    contest_counts = []
+    wall_start = time.perf_counter()
+    try:
+        for _ in range(cycles):
+            count, render_time = renderer.refresh()
+            contest_counts.append(count)
+            render_times.append(render_time)
+            clock.advance(interval)
+    finally:
+        renderer.close()
+        server.stop()
+
+    return {
+        'renderer': type(renderer).__name__,
+        'simulated_days': days,
+        'cycles': cycles,
+        'wall_seconds': time.perf_counter() - wall_start,
+        'fetches': transport.fetches,
+        'failures': transport.failures,
+        'bytes': transport.bytes,
+        'fetch_times': transport.fetch_times,
+        'render_times': render_times,
+        'contest_counts': contest_counts,
+    }
+
+
+def _summarize_times(times):
+    """Format mean / p95 / max in milliseconds"""
+    if not times:
+        return "n/a"
+    ordered = sorted(times)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (f"mean {statistics.mean(ordered) * 1000:.2f}ms | "
+            f"p95 {p95 * 1000:.2f}ms | max {ordered[-1] * 1000:.2f}ms")
+
+
+def print_report(stats):
+    print("\n" + "="*70)
+    print("SIMULATION REPORT")
+    print("="*70)
+    print(f"  Renderer: {stats['renderer']}")
+    print(f"  Simulated: {stats['simulated_days']} days in {stats['cycles']} refresh cycles")
+    print(f"  Wall time: {stats['wall_seconds']:.2f}s")
+    print(f"  Fetches: {stats['fetches']} ({stats['failures']} failed)")
+    print(f"  Bytes received: {stats['bytes']} "
+          f"({stats['bytes'] // max(stats['fetches'], 1)} per fetch)")
+    print(f"  Fetch time: {_summarize_times(stats['fetch_times'])}")
+    print(f"  Render time: {_summarize_times(stats['render_times'])}")
+    if stats['contest_counts']:
+        print(f"  Contests per cycle: min {min(stats['contest_counts'])} | "
+              f"max {max(stats['contest_counts'])}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description="Replay Contest Reminder auto-refresh cycles against a local stand-in API")
+    arg_parser.add_argument('--start', help="Start time, ISO format (default: now, IST)")
+    arg_parser.add_argument('--days', type=float, default=7, help="Simulated days to replay")
+    arg_parser.add_argument('--interval', type=float, default=REFRESH_INTERVAL_MS / 60000,
+                            help="Refresh interval in minutes")
+    arg_parser.add_argument('--size', type=int, default=50, help="Contests served by contest.list")
+    arg_parser.add_argument('--latency', type=float, default=0.0, help="Server latency in seconds")
+    arg_parser.add_argument('--failure-rate', type=float, default=0.0,
+                            help="Fraction of requests answered with 503")
+    arg_parser.add_argument('--seed', type=int, default=0, help="Random seed")
+    arg_parser.add_argument('--headless', action='store_true', help="Skip the Tkinter GUI")
+    args = arg_parser.parse_args()
+
+    if args.days < 0:
+        arg_parser.error("--days must not be negative")
+    if args.interval <= 0:
+        arg_parser.error("--interval must be positive")
+    if not 0 <= args.failure_rate <= 1:
+        arg_parser.error("--failure-rate must be between 0 and 1")
+
+    if args.start:
+        start = datetime.fromisoformat(args.start)
+        if start.tzinfo is None:
+            start = local_tz.localize(start)
+    else:
+        start = datetime.now(local_tz)
+
+    stats = run_simulation(start, days=args.days, interval=timedelta(minutes=args.interval),
+                           size=args.size, latency=args.latency,
+                           failure_rate=args.failure_rate, seed=args.seed,
+                           headless=args.headless)
+    print_report(stats)
+
+
+if __name__ == "__main__":
+    main()
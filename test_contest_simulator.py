@@ -0,0 +1,108 @@
+"""Checks for the simulation harness: run with pytest or `python test_contest_simulator.py`"""
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import pytz
+import requests
+
+import contest_reminder
+from contest_simulator import (CountingTransport, FakeClock, GuiRenderer,
+                               StandInCodeforces, run_simulation)
+
+local_tz = pytz.timezone('Asia/Kolkata')
+
+
+def ist(*args):
+    return local_tz.localize(datetime(*args))
+
+
+def test_codechef_before_wednesday_8pm_includes_tonight():
+    clock = FakeClock(ist(2025, 6, 4, 19, 59))  # Wednesday
+    contests = contest_reminder.generate_codechef_contests(clock)
+    assert contests[0]['start_time'] == ist(2025, 6, 4, 20, 0)
+
+
+def test_codechef_after_wednesday_8pm_rolls_over():
+    clock = FakeClock(ist(2025, 6, 4, 20, 30))  # Wednesday, contest already started
+    contests = contest_reminder.generate_codechef_contests(clock)
+    assert contests[0]['start_time'] == ist(2025, 6, 11, 20, 0)
+
+
+def test_server_failure_returns_503():
+    clock = FakeClock(ist(2025, 6, 4, 12, 0))
+    server = StandInCodeforces(clock, size=5, failure_rate=1.0).start()
+    transport = CountingTransport()
+    try:
+        response = transport(server.url, timeout=10)
+        assert response.status_code == 503
+        assert response.json()['status'] == 'FAILED'
+        assert transport.fetches == 1 and transport.failures == 1
+        assert contest_reminder.fetch_codeforces_contests(transport, server.url) == []
+    finally:
+        server.stop()
+
+
+def test_server_phase_follows_clock():
+    clock = FakeClock(ist(2025, 6, 4, 12, 0))
+    server = StandInCodeforces(clock, size=20, seed=1).start()
+    contest = max(server.contests, key=lambda c: c['startTimeSeconds'])
+    start = datetime.fromtimestamp(contest['startTimeSeconds'], tz=pytz.UTC)
+
+    def phase():
+        result = requests.get(server.url, timeout=10).json()['result']
+        return next(c['phase'] for c in result if c['id'] == contest['id'])
+
+    try:
+        clock.current = start - timedelta(minutes=1)
+        assert phase() == 'BEFORE'
+        clock.current = start + timedelta(minutes=1)
+        assert phase() == 'CODING'
+        clock.current = start + timedelta(seconds=contest['durationSeconds'])
+        assert phase() == 'FINISHED'
+    finally:
+        server.stop()
+
+
+def test_run_simulation_rejects_non_positive_interval():
+    for interval in (timedelta(0), timedelta(minutes=-30)):
+        try:
+            run_simulation(ist(2025, 6, 4, 12, 0), interval=interval, headless=True)
+        except ValueError:
+            continue
+        raise AssertionError(f"interval {interval} was accepted")
+
+
+def test_gui_startup_fetches_once():
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise unittest.SkipTest(f"No display for GUI startup check: {e}")
+    root.withdraw()
+
+    clock = FakeClock(ist(2025, 6, 4, 12, 0))
+    server = StandInCodeforces(clock, size=5).start()
+    transport = CountingTransport()
+    renderer = GuiRenderer(root, clock, transport, server.url, auto_refresh=True)
+    try:
+        renderer.wait_for_refresh()
+        # Give any stray refresh thread time to reach the server
+        time.sleep(0.2)
+        root.update()
+        assert transport.fetches == 1
+        assert len(renderer.render_times) == 1
+    finally:
+        renderer.close()
+        server.stop()
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith('test_') and callable(check):
+            try:
+                check()
+            except unittest.SkipTest as e:
+                print(f"skip  {name}: {e}")
+            else:
+                print(f"ok  {name}")